@@ -0,0 +1,101 @@
+"""Helpers shared by the benchmark management commands
+
+Benchmarks seed their data inside a transaction that is rolled back at the
+end, so they can be pointed at a development database without leaving rows
+behind. They are not meant to be run against production.
+"""
+
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+
+
+class Rollback(Exception):
+    """Raised to discard everything a benchmark wrote"""
+
+
+@contextmanager
+def rolled_back():
+    """Run the block in a transaction that is always rolled back"""
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def create_bench_user(label):
+    """Create a throwaway user to own the seeded rows"""
+    return get_user_model().objects.create_user(
+        f"bench-{label}-{time.monotonic_ns()}@example.com", "benchmark"
+    )
+
+
+def seed_user_data(user, rows, links_per_recipe=2):
+    """Insert `rows` tags, ingredients and recipes for user with set-based SQL
+
+    Every recipe is linked to `links_per_recipe` tags and ingredients, spread
+    evenly over the user's vocabulary.
+    """
+    with connection.cursor() as cursor:
+        for table in ("core_tag", "core_ingredient"):
+            cursor.execute(
+                f"INSERT INTO {table} (name, user_id) "
+                "SELECT 'name ' || md5(g::text), %s FROM generate_series(1, %s) g",
+                [user.id, rows],
+            )
+        cursor.execute(
+            "INSERT INTO core_recipe (title, time_minutes, price, link, user_id) "
+            "SELECT 'recipe ' || g, g %% 120, (g %% 10000) / 100.0, '', %s "
+            "FROM generate_series(1, %s) g",
+            [user.id, rows],
+        )
+        for table, column, model_table in (
+            ("core_recipe_tags", "tag_id", "core_tag"),
+            ("core_recipe_ingredients", "ingredient_id", "core_ingredient"),
+        ):
+            cursor.execute(
+                f"INSERT INTO {table} (recipe_id, {column}) "
+                "SELECT r.id, a.id FROM "
+                "(SELECT id, row_number() OVER (ORDER BY id) - 1 AS n "
+                " FROM core_recipe WHERE user_id = %s) r "
+                "CROSS JOIN generate_series(0, %s - 1) k "
+                "JOIN (SELECT id, row_number() OVER (ORDER BY id) - 1 AS n "
+                f"      FROM {model_table} WHERE user_id = %s) a "
+                "ON a.n = (r.n * 7 + k) %% %s",
+                [user.id, links_per_recipe, user.id, rows],
+            )
+        for table in (
+            "core_tag",
+            "core_ingredient",
+            "core_recipe",
+            "core_recipe_tags",
+            "core_recipe_ingredients",
+        ):
+            cursor.execute(f"ANALYZE {table}")
+
+
+def time_call(func, repeat):
+    """Return the median wall time of func() in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def plan_summary(queryset):
+    """Return the scan nodes and execution time of a queryset's actual plan"""
+    plan = queryset.explain(analyze=True).splitlines()
+    scans = []
+    for line in plan:
+        node = line.strip().lstrip("-> ").split("  (")[0]
+        if "Scan" in node and node not in scans:
+            scans.append(node)
+    execution = next((line for line in plan if line.startswith("Execution")), "")
+    return f"{'; '.join(scans)} [{execution}]"
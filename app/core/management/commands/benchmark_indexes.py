@@ -0,0 +1,101 @@
+from core.benchmark import (
+    create_bench_user,
+    plan_summary,
+    rolled_back,
+    seed_user_data,
+    time_call,
+)
+from core.models import Ingredient, Recipe, Tag
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+PER_USER_INDEXES = (
+    "tag_user_name_id_idx",
+    "ingredient_user_name_id_idx",
+    "recipe_user_id_idx",
+    "core_recipe_tags_tag_recipe_idx",
+    "core_recipe_ingredients_ingredient_recipe_idx",
+)
+
+PAGE_SIZE = 100
+
+
+def _hot_queries(user):
+    """Querysets mirroring what the recipe API runs for a user"""
+    tags = Tag.objects.filter(user=user).order_by("-name", "-id")
+    last_tag = list(tags[:PAGE_SIZE])[-1]
+    recipes = Recipe.objects.filter(user=user).order_by("-id")
+    tag_ids = list(tags.values_list("id", flat=True)[:3])
+    ingredient_links = Recipe.ingredients.through.objects.values("ingredient_id")
+
+    return [
+        ("tag list page", tags[:PAGE_SIZE]),
+        (
+            "tag keyset page",
+            tags.filter(name__lte=last_tag.name).exclude(
+                name=last_tag.name, id__gte=last_tag.id
+            )[:PAGE_SIZE],
+        ),
+        ("recipe list page", recipes[:PAGE_SIZE]),
+        (
+            "assigned ingredients",
+            Ingredient.objects.filter(user=user, pk__in=ingredient_links).order_by(
+                "-name", "-id"
+            )[:PAGE_SIZE],
+        ),
+        ("recipes by tags", recipes.filter(tags__id__in=tag_ids)[:PAGE_SIZE]),
+    ]
+
+
+class Command(BaseCommand):
+    """Compare plans and latency of per-user queries with and without indexes
+
+    Data is seeded and the indexes are dropped inside a transaction that is
+    rolled back, but DROP INDEX locks the tables until then: do not run this
+    against a database serving traffic.
+    """
+
+    help = "Benchmark the per-user indexes at several data sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[10000, 100000, 1000000],
+            help="Rows per table to seed for the benchmark user",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        for rows in options["rows"]:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{rows} rows per user"))
+            with rolled_back():
+                user = create_bench_user("indexes")
+                seed_user_data(user, rows)
+                queries = _hot_queries(user)
+                with_indexes = self._run(queries, options["repeat"])
+
+                with connection.cursor() as cursor:
+                    for index in PER_USER_INDEXES:
+                        cursor.execute(f"DROP INDEX {index}")
+                without_indexes = self._run(queries, options["repeat"])
+
+            for name, _queryset in queries:
+                before_ms, before_plan = without_indexes[name]
+                after_ms, after_plan = with_indexes[name]
+                self.stdout.write(
+                    f"  {name}: {before_ms:.2f} ms -> {after_ms:.2f} ms\n"
+                    f"    without: {before_plan}\n"
+                    f"    with:    {after_plan}"
+                )
+
+    def _run(self, queries, repeat):
+        """Return median latency and plan summary for each query"""
+        return {
+            name: (
+                time_call(lambda: list(queryset.all()), repeat),
+                plan_summary(queryset),
+            )
+            for name, queryset in queries
+        }
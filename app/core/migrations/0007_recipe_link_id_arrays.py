@@ -0,0 +1,111 @@
+# Generated by Django 2.2.28 on 2026-10-18 03:27
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Recompute the id arrays of a recipe row from the through tables whenever it
+# is written. The through table triggers below only touch the affected
+# recipes, which fires this.
+REFRESH_LINKS_SQL = """
+CREATE FUNCTION core_recipe_refresh_links() RETURNS trigger AS $$
+BEGIN
+    NEW.tag_ids := ARRAY(
+        SELECT tag_id FROM core_recipe_tags
+        WHERE recipe_id = NEW.id ORDER BY tag_id
+    );
+    NEW.ingredient_ids := ARRAY(
+        SELECT ingredient_id FROM core_recipe_ingredients
+        WHERE recipe_id = NEW.id ORDER BY ingredient_id
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_recipe_refresh_links
+BEFORE INSERT OR UPDATE ON core_recipe
+FOR EACH ROW EXECUTE PROCEDURE core_recipe_refresh_links();
+
+CREATE FUNCTION core_recipe_links_changed() RETURNS trigger AS $$
+BEGIN
+    UPDATE core_recipe SET tag_ids = tag_ids
+    WHERE id IN (SELECT recipe_id FROM changed_links);
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_REFRESH_LINKS_SQL = """
+DROP TRIGGER core_recipe_refresh_links ON core_recipe;
+DROP FUNCTION core_recipe_refresh_links();
+DROP FUNCTION core_recipe_links_changed();
+"""
+
+# statement level triggers, so a bulk insert or delete of links refreshes
+# each affected recipe once
+LINKS_CHANGED_SQL = """
+CREATE TRIGGER {table}_inserted
+AFTER INSERT ON {table} REFERENCING NEW TABLE AS changed_links
+FOR EACH STATEMENT EXECUTE PROCEDURE core_recipe_links_changed();
+
+CREATE TRIGGER {table}_deleted
+AFTER DELETE ON {table} REFERENCING OLD TABLE AS changed_links
+FOR EACH STATEMENT EXECUTE PROCEDURE core_recipe_links_changed();
+"""
+
+DROP_LINKS_CHANGED_SQL = """
+DROP TRIGGER {table}_inserted ON {table};
+DROP TRIGGER {table}_deleted ON {table};
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("core", "0006_per_user_indexes")]
+
+    operations = [
+        migrations.AddField(
+            model_name="recipe",
+            name="ingredient_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="recipe",
+            name="tag_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                default=list,
+                editable=False,
+                size=None,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recipe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tag_ids"], name="recipe_tag_ids_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recipe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["ingredient_ids"], name="recipe_ingredient_ids_gin"
+            ),
+        ),
+        migrations.RunSQL(REFRESH_LINKS_SQL, DROP_REFRESH_LINKS_SQL),
+        migrations.RunSQL(
+            LINKS_CHANGED_SQL.format(table="core_recipe_tags"),
+            DROP_LINKS_CHANGED_SQL.format(table="core_recipe_tags"),
+        ),
+        migrations.RunSQL(
+            LINKS_CHANGED_SQL.format(table="core_recipe_ingredients"),
+            DROP_LINKS_CHANGED_SQL.format(table="core_recipe_ingredients"),
+        ),
+        migrations.RunSQL(
+            "UPDATE core_recipe SET tag_ids = tag_ids", migrations.RunSQL.noop
+        ),
+    ]
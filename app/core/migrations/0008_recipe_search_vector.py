@@ -0,0 +1,90 @@
+# Generated by Django 2.2.28 on 2026-10-18 03:29
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Rebuild the search vector of a recipe row whenever it is written. Link
+# changes already touch the affected recipes (see 0007), which fires this.
+REFRESH_SEARCH_SQL = """
+CREATE FUNCTION core_recipe_refresh_search() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce((
+            SELECT string_agg(t.name, ' ') FROM core_tag t
+            JOIN core_recipe_tags rt ON rt.tag_id = t.id
+            WHERE rt.recipe_id = NEW.id
+        ), '')), 'B')
+        || setweight(to_tsvector('english', coalesce((
+            SELECT string_agg(i.name, ' ') FROM core_ingredient i
+            JOIN core_recipe_ingredients ri ON ri.ingredient_id = i.id
+            WHERE ri.recipe_id = NEW.id
+        ), '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_recipe_refresh_search
+BEFORE INSERT OR UPDATE ON core_recipe
+FOR EACH ROW EXECUTE PROCEDURE core_recipe_refresh_search();
+
+CREATE FUNCTION core_recipe_attr_renamed() RETURNS trigger AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'core_tag' THEN
+        UPDATE core_recipe SET tag_ids = tag_ids WHERE id IN (
+            SELECT recipe_id FROM core_recipe_tags WHERE tag_id = NEW.id
+        );
+    ELSE
+        UPDATE core_recipe SET tag_ids = tag_ids WHERE id IN (
+            SELECT recipe_id FROM core_recipe_ingredients
+            WHERE ingredient_id = NEW.id
+        );
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_tag_renamed
+AFTER UPDATE OF name ON core_tag
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE PROCEDURE core_recipe_attr_renamed();
+
+CREATE TRIGGER core_ingredient_renamed
+AFTER UPDATE OF name ON core_ingredient
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE PROCEDURE core_recipe_attr_renamed();
+"""
+
+DROP_REFRESH_SEARCH_SQL = """
+DROP TRIGGER core_ingredient_renamed ON core_ingredient;
+DROP TRIGGER core_tag_renamed ON core_tag;
+DROP FUNCTION core_recipe_attr_renamed();
+DROP TRIGGER core_recipe_refresh_search ON core_recipe;
+DROP FUNCTION core_recipe_refresh_search();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("core", "0007_recipe_link_id_arrays")]
+
+    operations = [
+        migrations.AddField(
+            model_name="recipe",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recipe",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="recipe_search_vector_gin"
+            ),
+        ),
+        migrations.RunSQL(REFRESH_SEARCH_SQL, DROP_REFRESH_SEARCH_SQL),
+        migrations.RunSQL(
+            "UPDATE core_recipe SET tag_ids = tag_ids", migrations.RunSQL.noop
+        ),
+    ]
@@ -7,8 +7,14 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+# text search configuration used to build and query Recipe.search_vector
+SEARCH_CONFIG = "english"
+
 
 def recipe_image_file_path(_instance, filename):
     """Generate new file path for recipe image"""
@@ -58,6 +64,11 @@ class Tag(models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "name", "id"], name="tag_user_name_id_idx")
+        ]
+
     def __str__(self):
         return self.name
 
@@ -68,6 +79,13 @@ class Ingredient(models.Model):
     name = models.CharField(max_length=255)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "name", "id"], name="ingredient_user_name_id_idx"
+            )
+        ]
+
     def __str__(self):
         return self.name
 
@@ -83,6 +101,21 @@ class Recipe(models.Model):
     ingredients = models.ManyToManyField(to="Ingredient")
     tags = models.ManyToManyField(to="Tag")
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
+    # copies of the tags/ingredients links kept in sync by database triggers
+    # (see migration 0007), so recipes can be matched on sets of ids
+    tag_ids = ArrayField(models.IntegerField(), default=list, editable=False)
+    ingredient_ids = ArrayField(models.IntegerField(), default=list, editable=False)
+    # weighted title, tag names and ingredient names, also maintained by
+    # database triggers (see migration 0008)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "id"], name="recipe_user_id_idx"),
+            GinIndex(fields=["tag_ids"], name="recipe_tag_ids_gin"),
+            GinIndex(fields=["ingredient_ids"], name="recipe_ingredient_ids_gin"),
+            GinIndex(fields=["search_vector"], name="recipe_search_vector_gin"),
+        ]
 
     def __str__(self):
         return self.title
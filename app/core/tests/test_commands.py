@@ -1,5 +1,7 @@
+from io import StringIO
 from unittest.mock import patch
 
+from django.contrib.auth import get_user_model
 from django.core.management import call_command
 from django.db.utils import OperationalError
 from django.test import TestCase
@@ -20,3 +22,14 @@ class CommandTests(TestCase):
             gi.side_effect = [OperationalError] * 5 + [True]
             call_command("wait_for_db")
             self.assertEqual(gi.call_count, 6)
+
+    def test_benchmark_indexes(self):
+        """Test the index benchmark reports each query and leaves no data"""
+        out = StringIO()
+        call_command("benchmark_indexes", rows=[20], repeat=1, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("20 rows per user", output)
+        self.assertIn("assigned ingredients", output)
+        self.assertIn("without:", output)
+        self.assertFalse(get_user_model().objects.exists())
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 from core import models
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
 
 
@@ -69,3 +70,41 @@ class ModelTests(TestCase):
         file_path = models.recipe_image_file_path(None, "myimage.jpg")
 
         assert file_path == f"uploads/recipe/{uuid}.jpg"
+
+    def test_through_tables_indexed_in_reverse(self):
+        """Test the through tables have (attribute, recipe) indexes"""
+        with connection.cursor() as cursor:
+            for table, columns in (
+                ("core_recipe_tags", ["tag_id", "recipe_id"]),
+                ("core_recipe_ingredients", ["ingredient_id", "recipe_id"]),
+            ):
+                constraints = connection.introspection.get_constraints(cursor, table)
+                self.assertIn(
+                    columns,
+                    [c["columns"] for c in constraints.values() if c["index"]],
+                )
+
+    def test_recipe_link_ids_kept_in_sync(self):
+        """Test the recipe tag and ingredient id arrays follow link changes"""
+        user = sample_user()
+        recipe = models.Recipe.objects.create(
+            user=user, title="Pad Thai", time_minutes=20, price=8.00
+        )
+        tag1 = models.Tag.objects.create(user=user, name="Thai")
+        tag2 = models.Tag.objects.create(user=user, name="Noodles")
+        ingredient = models.Ingredient.objects.create(user=user, name="Peanuts")
+
+        recipe.tags.add(tag1, tag2)
+        recipe.ingredients.add(ingredient)
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.tag_ids, sorted([tag1.id, tag2.id]))
+        self.assertEqual(recipe.ingredient_ids, [ingredient.id])
+
+        stale = models.Recipe.objects.get(id=recipe.id)
+        recipe.tags.remove(tag1)
+        ingredient.delete()
+        stale.title = "Pad See Ew"
+        stale.save()
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.tag_ids, [tag2.id])
+        self.assertEqual(recipe.ingredient_ids, [])
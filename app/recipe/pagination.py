@@ -0,0 +1,120 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def _positive_int(value, default, cutoff):
+    """Parse a positive integer from a query param, capped at cutoff"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    if value <= 0:
+        return default
+    return min(value, cutoff)
+
+
+class KeysetPagination(BasePagination):
+    """Opt-in cursor pagination seeking on the view's ordering columns
+
+    Pagination only kicks in when the client sends `page_size` or `cursor`.
+    Each page is fetched with a WHERE on the last row's ordering values
+    instead of an OFFSET, so every page costs the same as the first and rows
+    inserted meanwhile never shift later pages. No COUNT(*) is run.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 100
+    max_page_size = 1000
+    ordering = ("-id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a page of results, or None if pagination was not requested"""
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+
+        self.request = request
+        self.ordering = tuple(self.get_ordering(view))
+        page_size = _positive_int(
+            params.get(self.page_size_query_param), self.page_size, self.max_page_size
+        )
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(params.get(self.cursor_query_param))
+        if position is not None:
+            queryset = queryset.filter(self._seek_filter(position))
+
+        # fetch one extra row to know whether there is a next page
+        results = list(queryset[: page_size + 1])
+        self.has_next = len(results) > page_size
+        results = results[:page_size]
+        self.next_position = self._get_position(results[-1]) if self.has_next else None
+
+        return results
+
+    def get_ordering(self, view):
+        """Return the view's ordering, which must end on a unique column"""
+        if hasattr(view, "get_ordering"):
+            return view.get_ordering()
+        return getattr(view, "ordering", self.ordering)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.next_position),
+        )
+
+    def encode_cursor(self, position):
+        """Encode a list of ordering values as an opaque cursor string"""
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Decode a cursor string back to a list of ordering values"""
+        if cursor is None:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound("Invalid cursor")
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound("Invalid cursor")
+
+        return position
+
+    def _get_position(self, obj):
+        return [getattr(obj, field.lstrip("-")) for field in self.ordering]
+
+    def _seek_filter(self, position):
+        """Build a filter selecting rows strictly after position
+
+        For ordering (-name, -id) this is `name < x OR (name = x AND id < y)`.
+        """
+        seek = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            seek |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        return seek
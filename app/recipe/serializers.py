@@ -1,6 +1,57 @@
 from core.models import Ingredient, Recipe, Tag
+from django.db import transaction
+from django.db.models import Q
 from rest_framework import serializers
 
+RECIPE_RELATIONS = ("tags", "ingredients")
+
+
+def _set_links(relation, links, replace=True):
+    """Set the `relation` links of many recipes with bulk writes
+
+    `links` maps recipe ids to the related objects they should end up with.
+    Only the difference from the current links is written: one DELETE and one
+    INSERT on the through table at most. Pass replace=False for new recipes
+    that have no links yet.
+    """
+    field = Recipe._meta.get_field(relation)
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    target = f"{field.m2m_reverse_field_name()}_id"
+
+    wanted = {(recipe_id, obj.pk) for recipe_id, objs in links.items() for obj in objs}
+    existing = set()
+    if replace and links:
+        existing = set(
+            through.objects.filter(**{f"{source}__in": list(links)}).values_list(
+                source, target
+            )
+        )
+
+    stale = {}
+    for recipe_id, obj_id in existing - wanted:
+        stale.setdefault(recipe_id, []).append(obj_id)
+    if stale:
+        condition = Q()
+        for recipe_id, obj_ids in stale.items():
+            condition |= Q(**{source: recipe_id, f"{target}__in": obj_ids})
+        through.objects.filter(condition).delete()
+
+    missing = wanted - existing
+    if missing:
+        through.objects.bulk_create(
+            [through(**{source: pair[0], target: pair[1]}) for pair in missing]
+        )
+
+
+def _pop_links(attrs):
+    """Remove the many to many values from validated attrs"""
+    return {
+        relation: attrs.pop(relation)
+        for relation in RECIPE_RELATIONS
+        if relation in attrs
+    }
+
 
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for tag objects"""
@@ -20,6 +71,62 @@ class IngredientSerializer(serializers.ModelSerializer):
         read_only_fields = ("id",)
 
 
+class AttrNamesSerializer(serializers.Serializer):
+    """Serializer for a batch of tag or ingredient names"""
+
+    names = serializers.ListField(
+        child=serializers.CharField(max_length=255), allow_empty=False, max_length=1000
+    )
+
+
+class RecipeListSerializer(serializers.ListSerializer):
+    """Write many recipes at once with batched inserts and updates"""
+
+    def create(self, validated_data):
+        """Create all recipes and their links in one transaction"""
+        links = [_pop_links(attrs) for attrs in validated_data]
+        with transaction.atomic():
+            recipes = Recipe.objects.bulk_create(
+                [Recipe(**attrs) for attrs in validated_data]
+            )
+            for relation in RECIPE_RELATIONS:
+                _set_links(
+                    relation,
+                    {
+                        recipe.pk: recipe_links[relation]
+                        for recipe, recipe_links in zip(recipes, links)
+                        if relation in recipe_links
+                    },
+                    replace=False,
+                )
+
+        return recipes
+
+    def update(self, instances, validated_data):
+        """Update recipes matched by position with validated_data"""
+        links = [_pop_links(attrs) for attrs in validated_data]
+        fields = set()
+        for instance, attrs in zip(instances, validated_data):
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+                fields.add(attr)
+
+        with transaction.atomic():
+            if fields:
+                Recipe.objects.bulk_update(instances, fields)
+            for relation in RECIPE_RELATIONS:
+                _set_links(
+                    relation,
+                    {
+                        instance.pk: recipe_links[relation]
+                        for instance, recipe_links in zip(instances, links)
+                        if relation in recipe_links
+                    },
+                )
+
+        return instances
+
+
 class RecipeSerializer(serializers.ModelSerializer):
     """Serializer for recipe objects"""
 
@@ -32,6 +139,7 @@ class RecipeSerializer(serializers.ModelSerializer):
         model = Recipe
         fields = ("id", "title", "ingredients", "tags", "time_minutes", "price", "link")
         read_only_fields = ("id",)
+        list_serializer_class = RecipeListSerializer
 
 
 class RecipeDetailSerializer(RecipeSerializer):
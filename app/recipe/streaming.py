@@ -0,0 +1,61 @@
+from itertools import islice
+
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def _chunks(iterable, size):
+    """Yield lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def stream_json_array(queryset, serializer_class, context=None, chunk_size=500):
+    """Serialize a queryset into a JSON array, one chunk of rows at a time
+
+    Rows are read through QuerySet.iterator(), which uses a server-side cursor
+    on PostgreSQL. iterator() skips prefetch_related, so the queryset's
+    prefetches are run per chunk instead.
+    """
+    encoder = JSONEncoder()
+    prefetch = queryset._prefetch_related_lookups
+    separator = ""
+
+    yield "["
+    for chunk in _chunks(queryset.iterator(chunk_size=chunk_size), chunk_size):
+        if prefetch:
+            prefetch_related_objects(chunk, *prefetch)
+        data = serializer_class(chunk, many=True, context=context).data
+        yield separator + ",".join(encoder.encode(item) for item in data)
+        separator = ","
+    yield "]"
+
+
+class StreamingListMixin(object):
+    """Stream the list action as a JSON array when `stream` is passed
+
+    Streaming bypasses pagination and keeps memory flat regardless of how many
+    objects the user owns.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        if not request.query_params.get(self.stream_query_param):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            stream_json_array(
+                queryset,
+                self.get_serializer_class(),
+                context=self.get_serializer_context(),
+                chunk_size=self.stream_chunk_size,
+            ),
+            content_type="application/json",
+        )
@@ -1,6 +1,10 @@
+from contextlib import contextmanager
+
 import pytest
 from core.models import Ingredient, Recipe, Tag
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from recipe.serializers import RecipeSerializer
 from rest_framework.test import APIClient
 
@@ -104,6 +108,33 @@ def recipe_with_tag_ingredient1(test_user, sample_tag1, sample_ingredient1):
     return recipe
 
 
+@pytest.fixture
+def make_recipes():
+    """Factory creating `count` recipes for a user, each with its own tags and
+    ingredients"""
+
+    def _make_recipes(user, count, tags_per_recipe=2, ingredients_per_recipe=2):
+        recipes = []
+        for i in range(count):
+            recipe = _sample_recipe(user=user, title=f"Recipe {i}")
+            recipe.tags.add(
+                *[
+                    _sample_tag(user=user, name=f"Tag {i}-{j}")
+                    for j in range(tags_per_recipe)
+                ]
+            )
+            recipe.ingredients.add(
+                *[
+                    _sample_ingredient(user=user, name=f"Ingredient {i}-{j}")
+                    for j in range(ingredients_per_recipe)
+                ]
+            )
+            recipes.append(recipe)
+        return recipes
+
+    return _make_recipes
+
+
 # ----------------- SERIALIZERS ------------------------------
 @pytest.fixture
 def sample_recipe1_serializer(sample_recipe1):
@@ -120,6 +151,26 @@ def recipe_with_tag_ingredient2_serializer(recipe_with_tag_ingredient2):
     return RecipeSerializer(recipe_with_tag_ingredient2)
 
 
+# ------------------- QUERY BUDGET ---------------------------
+@pytest.fixture
+def query_budget():
+    """Context manager failing the test if the block runs more than `max_queries`
+    database queries"""
+
+    @contextmanager
+    def _query_budget(max_queries):
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        executed = [query["sql"] for query in context.captured_queries]
+        assert (
+            len(executed) <= max_queries
+        ), f"{len(executed)} queries executed, budget is {max_queries}:\n" + "\n".join(
+            executed
+        )
+
+    return _query_budget
+
+
 # ----------- HELPER FUNCTIONS ----------------
 def _sample_recipe(user, **params):
     """Create and return a sample recipe"""
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from core.models import Ingredient, Tag
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+
+ATTR_ENDPOINTS = [("recipe:tag-bulk", Tag), ("recipe:ingredient-bulk", Ingredient)]
+
+
+class TestPublicBulkAttrsAPI(object):
+    @pytest.mark.parametrize("url_name,model", ATTR_ENDPOINTS)
+    def test_auth_required(self, public_client, url_name, model):
+        """Test that authentication is required"""
+        res = public_client.post(reverse(url_name), {"names": ["Salt"]}, format="json")
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# noinspection PyMethodMayBeStatic,PyUnusedLocal
+@pytest.mark.parametrize("url_name,model", ATTR_ENDPOINTS)
+class TestBulkAttrsAPI(object):
+    def test_get_or_create(
+        self, authenticated_client, test_user, test_user2, url_name, model
+    ):
+        """Test that only missing names are created and all ids are returned"""
+        existing = model.objects.create(user=test_user, name="Salt")
+        other = model.objects.create(user=test_user2, name="Pepper")
+        payload = {"names": ["Salt", "Pepper", " Basil ", "Pepper"]}
+
+        res = authenticated_client.post(reverse(url_name), payload, format="json")
+
+        assert res.status_code == status.HTTP_201_CREATED
+        assert res.data["created"] == ["Pepper", "Basil"]
+        assert list(res.data["ids"]) == ["Salt", "Pepper", "Basil"]
+        assert res.data["ids"]["Salt"] == existing.id
+        assert res.data["ids"]["Pepper"] != other.id
+        assert model.objects.filter(user=test_user).count() == 3
+        for name, obj_id in res.data["ids"].items():
+            assert model.objects.get(id=obj_id, user=test_user).name == name
+
+    def test_all_existing(
+        self, authenticated_client, test_user, query_budget, url_name, model
+    ):
+        """Test that a batch of known names creates nothing"""
+        for name in ["Salt", "Pepper"]:
+            model.objects.create(user=test_user, name=name)
+
+        with query_budget(4):
+            res = authenticated_client.post(
+                reverse(url_name), {"names": ["Salt", "Pepper"]}, format="json"
+            )
+
+        assert res.status_code == status.HTTP_200_OK
+        assert res.data["created"] == []
+        assert model.objects.filter(user=test_user).count() == 2
+
+    def test_query_count_independent_of_size(
+        self, authenticated_client, test_user, query_budget, url_name, model
+    ):
+        """Test that a large batch is resolved in a constant number of queries"""
+        names = [f"Name {i}" for i in range(200)]
+        model.objects.create(user=test_user, name="Name 0")
+
+        # savepoint, lock, lookup, insert, release
+        with query_budget(5):
+            res = authenticated_client.post(
+                reverse(url_name), {"names": names}, format="json"
+            )
+
+        assert res.status_code == status.HTTP_201_CREATED
+        assert len(res.data["created"]) == 199
+        assert model.objects.filter(user=test_user).count() == 200
+
+    @pytest.mark.parametrize("payload", [{}, {"names": []}, {"names": [""]}, []])
+    def test_invalid_payload(self, authenticated_client, url_name, model, payload):
+        """Test that malformed batches are rejected"""
+        res = authenticated_client.post(reverse(url_name), payload, format="json")
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("url_name,model", ATTR_ENDPOINTS)
+def test_concurrent_batches_create_once(test_user, url_name, model):
+    """Test that concurrent batches with the same names do not duplicate rows"""
+    names = [f"Name {i}" for i in range(50)]
+
+    def _post(_):
+        client = APIClient()
+        client.force_authenticate(test_user)
+        try:
+            return client.post(reverse(url_name), {"names": names}, format="json")
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(_post, range(4)))
+
+    assert all(res.data["ids"] == responses[0].data["ids"] for res in responses)
+    assert sum(len(res.data["created"]) for res in responses) == len(names)
+    assert model.objects.filter(user=test_user).count() == len(names)
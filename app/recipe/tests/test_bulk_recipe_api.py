@@ -0,0 +1,158 @@
+import pytest
+from core.models import Recipe
+from django.urls import reverse
+from recipe.views import RecipeViewSet
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def bulk_url():
+    return reverse("recipe:recipe-bulk")
+
+
+class TestPublicBulkRecipeAPI(object):
+    def test_auth_required(self, public_client, bulk_url):
+        """Test that authentication is required"""
+        res = public_client.post(bulk_url, [], format="json")
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# noinspection PyMethodMayBeStatic,PyUnusedLocal
+class TestBulkRecipeAPI(object):
+    def test_bulk_create(
+        self,
+        authenticated_client,
+        bulk_url,
+        test_user,
+        sample_tag1,
+        sample_tag2,
+        sample_ingredient1,
+    ):
+        """Test creating many recipes in one request"""
+        payload = [
+            {
+                "title": f"Recipe {i}",
+                "time_minutes": 10 + i,
+                "price": "5.00",
+                "tags": [sample_tag1.id, sample_tag2.id],
+                "ingredients": [sample_ingredient1.id],
+            }
+            for i in range(20)
+        ]
+
+        res = authenticated_client.post(bulk_url, payload, format="json")
+
+        assert res.status_code == status.HTTP_201_CREATED
+        assert [r["title"] for r in res.data] == [p["title"] for p in payload]
+        recipes = Recipe.objects.filter(user=test_user)
+        assert recipes.count() == 20
+        for recipe in recipes:
+            assert set(recipe.tags.all()) == {sample_tag1, sample_tag2}
+            assert list(recipe.ingredients.all()) == [sample_ingredient1]
+
+    def test_bulk_create_invalid_item(self, authenticated_client, bulk_url, test_user):
+        """Test that one invalid recipe rejects the whole batch"""
+        payload = [
+            {
+                "title": "Good",
+                "time_minutes": 5,
+                "price": "1.00",
+                "tags": [],
+                "ingredients": [],
+            },
+            {
+                "title": "",
+                "time_minutes": 5,
+                "price": "1.00",
+                "tags": [],
+                "ingredients": [],
+            },
+        ]
+
+        res = authenticated_client.post(bulk_url, payload, format="json")
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+        assert res.data[0] == {}
+        assert "title" in res.data[1]
+        assert not Recipe.objects.filter(user=test_user).exists()
+
+    def test_bulk_create_too_many(self, authenticated_client, bulk_url, monkeypatch):
+        """Test that oversized batches are rejected"""
+        monkeypatch.setattr(RecipeViewSet, "bulk_max_items", 1)
+        payload = [{"title": "A"}, {"title": "B"}]
+
+        res = authenticated_client.post(bulk_url, payload, format="json")
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_partial_update(
+        self,
+        authenticated_client,
+        bulk_url,
+        recipe_with_tag_ingredient1,
+        recipe_with_tag_ingredient2,
+        sample_tag1,
+        sample_tag2,
+    ):
+        """Test patching many recipes at once"""
+        payload = [
+            {"id": recipe_with_tag_ingredient1.id, "title": "Renamed"},
+            {"id": recipe_with_tag_ingredient2.id, "tags": [sample_tag1.id]},
+        ]
+
+        res = authenticated_client.patch(bulk_url, payload, format="json")
+
+        assert res.status_code == status.HTTP_200_OK
+        recipe_with_tag_ingredient1.refresh_from_db()
+        recipe_with_tag_ingredient2.refresh_from_db()
+        assert recipe_with_tag_ingredient1.title == "Renamed"
+        assert list(recipe_with_tag_ingredient1.tags.all()) == [sample_tag1]
+        assert recipe_with_tag_ingredient2.title == "Aubergine with tahini"
+        assert list(recipe_with_tag_ingredient2.tags.all()) == [sample_tag1]
+
+    def test_bulk_update_unknown_ids(
+        self, authenticated_client, bulk_url, user2_recipe, sample_recipe1
+    ):
+        """Test that ids of other users or missing ids are reported per item"""
+        payload = [
+            {"id": sample_recipe1.id, "title": "Mine"},
+            {"id": user2_recipe.id, "title": "Not mine"},
+            {"title": "No id"},
+        ]
+
+        res = authenticated_client.patch(bulk_url, payload, format="json")
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+        assert res.data[0] == {}
+        assert "id" in res.data[1]
+        assert "id" in res.data[2]
+        sample_recipe1.refresh_from_db()
+        assert sample_recipe1.title != "Mine"
+
+    def test_bulk_delete(
+        self,
+        authenticated_client,
+        bulk_url,
+        test_user,
+        sample_recipe1,
+        recipe_with_tag_ingredient1,
+        user2_recipe,
+    ):
+        """Test deleting many recipes by id"""
+        ids = [sample_recipe1.id, recipe_with_tag_ingredient1.id, user2_recipe.id]
+
+        res = authenticated_client.delete(bulk_url, {"ids": ids}, format="json")
+
+        assert res.status_code == status.HTTP_200_OK
+        assert res.data == {"deleted": ids[:2], "not_found": [user2_recipe.id]}
+        assert not Recipe.objects.filter(user=test_user).exists()
+        assert Recipe.objects.filter(id=user2_recipe.id).exists()
+
+    def test_bulk_delete_invalid(self, authenticated_client, bulk_url):
+        """Test deleting with a malformed id list"""
+        res = authenticated_client.delete(bulk_url, {"ids": "1,2"}, format="json")
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
@@ -89,3 +89,56 @@ class TestPrivateIngredientsAPI(object):
         assert (
             unassigned_serializer.data not in res.data
         ), "Should not return unassigned ingredient"
+
+    def test_assigned_ingredients_unique(
+        self,
+        sample_ingredient1,
+        sample_ingredient2,
+        test_user,
+        make_recipes,
+        authenticated_client,
+        ingredients_url,
+    ):
+        """Test assigned ingredients are returned once however many recipes use them"""
+        for recipe in make_recipes(
+            test_user, 5, tags_per_recipe=0, ingredients_per_recipe=0
+        ):
+            recipe.ingredients.add(sample_ingredient1, sample_ingredient2)
+
+        res = authenticated_client.get(ingredients_url, {"assigned_only": 1})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert sorted(item["id"] for item in res.data) == sorted(
+            [sample_ingredient1.id, sample_ingredient2.id]
+        )
+
+    def test_filter_ingredients_min_recipes(
+        self,
+        sample_ingredient1,
+        sample_ingredient2,
+        test_user,
+        make_recipes,
+        authenticated_client,
+        ingredients_url,
+    ):
+        """Test filtering ingredients used by at least N recipes"""
+        recipes = make_recipes(
+            test_user, 3, tags_per_recipe=0, ingredients_per_recipe=0
+        )
+        for recipe in recipes:
+            recipe.ingredients.add(sample_ingredient1)
+        recipes[0].ingredients.add(sample_ingredient2)
+
+        res = authenticated_client.get(ingredients_url, {"min_recipes": 3})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in res.data] == [sample_ingredient1.id]
+
+    @pytest.mark.parametrize("min_recipes", ["0", "-1", "many"])
+    def test_filter_ingredients_min_recipes_invalid(
+        self, authenticated_client, ingredients_url, min_recipes
+    ):
+        """Test that an invalid min_recipes returns 400"""
+        res = authenticated_client.get(ingredients_url, {"min_recipes": min_recipes})
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,103 @@
+import pytest
+from core.models import Recipe, Tag
+from django.urls import reverse
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+
+def _walk_pages(client, url, params):
+    """Follow next links from the first page and return every page's results"""
+    pages = []
+    res = client.get(url, params)
+    while True:
+        assert res.status_code == status.HTTP_200_OK
+        pages.append(res.data["results"])
+        if res.data["next"] is None:
+            return pages
+        res = client.get(res.data["next"])
+
+
+class TestKeysetPagination(object):
+    """Test opt-in cursor pagination on the recipe API"""
+
+    def test_unpaginated_by_default(
+        self, authenticated_client, test_user, make_recipes
+    ):
+        """Test that lists are not paginated unless requested"""
+        make_recipes(test_user, 3)
+
+        res = authenticated_client.get(reverse("recipe:recipe-list"))
+
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) == 3
+
+    def test_paginate_recipes(self, authenticated_client, test_user, make_recipes):
+        """Test walking all recipe pages returns each recipe once in order"""
+        make_recipes(test_user, 5)
+
+        pages = _walk_pages(
+            authenticated_client, reverse("recipe:recipe-list"), {"page_size": 2}
+        )
+
+        ids = [recipe["id"] for page in pages for recipe in page]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert ids == list(
+            Recipe.objects.filter(user=test_user)
+            .order_by("-id")
+            .values_list("id", flat=True)
+        )
+
+    def test_paginate_tags_with_duplicate_names(self, authenticated_client, test_user):
+        """Test that tags sharing a name are not skipped across pages"""
+        for name in ["Dinner", "Lunch", "Lunch", "Lunch", "Breakfast"]:
+            Tag.objects.create(user=test_user, name=name)
+
+        pages = _walk_pages(
+            authenticated_client, reverse("recipe:tag-list"), {"page_size": 2}
+        )
+
+        ids = [tag["id"] for page in pages for tag in page]
+        assert ids == list(
+            Tag.objects.filter(user=test_user)
+            .order_by("-name", "-id")
+            .values_list("id", flat=True)
+        )
+
+    def test_pages_stable_under_inserts(
+        self, authenticated_client, test_user, make_recipes
+    ):
+        """Test that recipes created between pages do not shift later pages"""
+        recipes = make_recipes(test_user, 4)
+        url = reverse("recipe:recipe-list")
+
+        first = authenticated_client.get(url, {"page_size": 2})
+        make_recipes(test_user, 2)
+        second = authenticated_client.get(first.data["next"])
+
+        ids = [r["id"] for r in first.data["results"] + second.data["results"]]
+        assert ids == [recipe.id for recipe in reversed(recipes)]
+
+    def test_page_runs_no_count(
+        self, authenticated_client, test_user, make_recipes, query_budget
+    ):
+        """Test that fetching a page does not count the whole table"""
+        make_recipes(test_user, 5)
+        url = reverse("recipe:recipe-list")
+        first = authenticated_client.get(url, {"page_size": 2})
+
+        with query_budget(3) as context:
+            res = authenticated_client.get(first.data["next"])
+
+        assert res.status_code == status.HTTP_200_OK
+        assert not any(
+            "COUNT(" in query["sql"].upper() for query in context.captured_queries
+        )
+
+    def test_invalid_cursor(self, authenticated_client):
+        """Test that a malformed cursor returns 404"""
+        res = authenticated_client.get(
+            reverse("recipe:tag-list"), {"cursor": "not-a-cursor"}
+        )
+
+        assert res.status_code == status.HTTP_404_NOT_FOUND
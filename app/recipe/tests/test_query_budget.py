@@ -0,0 +1,87 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+# maximum number of queries per endpoint, independent of the amount of data
+RECIPE_LIST_BUDGET = 3
+RECIPE_DETAIL_BUDGET = 3
+ATTR_LIST_BUDGET = 1
+
+DATA_SIZES = [1, 10, 50]
+
+
+class TestRecipeQueryBudget(object):
+    """Test that recipe endpoints run a constant number of queries"""
+
+    @pytest.mark.parametrize("count", DATA_SIZES)
+    def test_list_recipes(
+        self, authenticated_client, test_user, make_recipes, query_budget, count
+    ):
+        """Test listing recipes does not query per recipe"""
+        make_recipes(test_user, count)
+
+        with query_budget(RECIPE_LIST_BUDGET):
+            res = authenticated_client.get(reverse("recipe:recipe-list"))
+
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) == count
+
+    @pytest.mark.parametrize("count", DATA_SIZES)
+    def test_filter_recipes(
+        self, authenticated_client, test_user, make_recipes, query_budget, count
+    ):
+        """Test filtering recipes does not query per recipe"""
+        recipes = make_recipes(test_user, count)
+        tag_ids = ",".join(str(recipe.tags.first().id) for recipe in recipes)
+
+        with query_budget(RECIPE_LIST_BUDGET):
+            res = authenticated_client.get(
+                reverse("recipe:recipe-list"), {"tags": tag_ids}
+            )
+
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) == count
+
+    @pytest.mark.parametrize("count", DATA_SIZES)
+    def test_recipe_detail(
+        self, authenticated_client, test_user, make_recipes, query_budget, count
+    ):
+        """Test retrieving a recipe does not query per tag or ingredient"""
+        (recipe,) = make_recipes(
+            test_user, 1, tags_per_recipe=count, ingredients_per_recipe=count
+        )
+
+        with query_budget(RECIPE_DETAIL_BUDGET):
+            res = authenticated_client.get(
+                reverse("recipe:recipe-detail", args=[recipe.id])
+            )
+
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data["tags"]) == count
+        assert len(res.data["ingredients"]) == count
+
+
+class TestAttrQueryBudget(object):
+    """Test that tag and ingredient endpoints run a constant number of queries"""
+
+    @pytest.mark.parametrize("url_name", ["recipe:tag-list", "recipe:ingredient-list"])
+    @pytest.mark.parametrize("count", DATA_SIZES)
+    def test_list_attrs(
+        self,
+        authenticated_client,
+        test_user,
+        make_recipes,
+        query_budget,
+        url_name,
+        count,
+    ):
+        """Test listing tags and ingredients does not query per object"""
+        make_recipes(test_user, count)
+
+        with query_budget(ATTR_LIST_BUDGET):
+            res = authenticated_client.get(reverse(url_name))
+
+        assert res.status_code == status.HTTP_200_OK
+        assert len(res.data) == count * 2
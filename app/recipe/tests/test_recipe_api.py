@@ -249,3 +249,55 @@ class TestRecipeImageUpload(object):
         assert recipe_with_tag_ingredient1_serializer.data in res.data
         assert recipe_with_tag_ingredient2_serializer.data in res.data
         assert sample_recipe1_serializer.data not in res.data
+
+    def test_filter_recipes_match_all_tags(
+        self,
+        recipe_with_tag_ingredient1,
+        recipe_with_tag_ingredient2,
+        sample_tag1,
+        sample_tag2,
+        authenticated_client,
+        recipes_url,
+    ):
+        """Test returning recipes having all of the given tags"""
+        recipe_with_tag_ingredient2.tags.add(sample_tag1)
+
+        res = authenticated_client.get(
+            recipes_url, {"tags": f"{sample_tag1.id},{sample_tag2.id}", "match": "all"}
+        )
+
+        assert res.status_code == status.HTTP_200_OK
+        assert [r["id"] for r in res.data] == [recipe_with_tag_ingredient2.id]
+
+    def test_filter_recipes_match_any_returns_once(
+        self,
+        recipe_with_tag_ingredient1,
+        sample_tag1,
+        sample_tag2,
+        authenticated_client,
+        recipes_url,
+    ):
+        """Test a recipe matching several of the given tags is returned once"""
+        recipe_with_tag_ingredient1.tags.add(sample_tag2)
+
+        res = authenticated_client.get(
+            recipes_url, {"tags": f"{sample_tag1.id},{sample_tag2.id}"}
+        )
+
+        assert [r["id"] for r in res.data] == [recipe_with_tag_ingredient1.id]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"tags": "1,a"},
+            {"ingredients": "1,,2"},
+            {"tags": "-1"},
+            {"tags": "99999999999"},
+            {"tags": "1", "match": "some"},
+        ],
+    )
+    def test_filter_recipes_invalid(self, authenticated_client, recipes_url, params):
+        """Test malformed filters return 400"""
+        res = authenticated_client.get(recipes_url, params)
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
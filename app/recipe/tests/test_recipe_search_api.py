@@ -0,0 +1,101 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def recipes_url():
+    return reverse("recipe:recipe-list")
+
+
+def _ids(res):
+    return [recipe["id"] for recipe in res.data]
+
+
+# noinspection PyMethodMayBeStatic,PyUnusedLocal
+class TestRecipeSearch(object):
+    def test_search_title(
+        self,
+        authenticated_client,
+        recipes_url,
+        recipe_with_tag_ingredient1,
+        recipe_with_tag_ingredient2,
+    ):
+        """Test searching recipes by words of their title"""
+        res = authenticated_client.get(recipes_url, {"search": "curries"})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert _ids(res) == [recipe_with_tag_ingredient1.id]
+
+    def test_search_tags_and_ingredients(
+        self,
+        authenticated_client,
+        recipes_url,
+        recipe_with_tag_ingredient1,
+        recipe_with_tag_ingredient2,
+        sample_tag2,
+    ):
+        """Test searching recipes by tag and ingredient names"""
+        by_tag = authenticated_client.get(recipes_url, {"search": "vegetarian"})
+        by_ingredient = authenticated_client.get(recipes_url, {"search": "eggplant"})
+
+        assert _ids(by_tag) == [recipe_with_tag_ingredient2.id]
+        assert _ids(by_ingredient) == [recipe_with_tag_ingredient2.id]
+
+    def test_search_follows_renames(
+        self,
+        authenticated_client,
+        recipes_url,
+        recipe_with_tag_ingredient1,
+        sample_ingredient1,
+    ):
+        """Test renaming an ingredient updates the recipes it is used in"""
+        sample_ingredient1.name = "Lemongrass"
+        sample_ingredient1.save()
+
+        res = authenticated_client.get(recipes_url, {"search": "lemongrass"})
+
+        assert _ids(res) == [recipe_with_tag_ingredient1.id]
+
+    def test_search_ranks_title_first(
+        self, authenticated_client, recipes_url, test_user, make_recipes
+    ):
+        """Test title matches rank above tag and ingredient matches"""
+        by_ingredient, by_title = make_recipes(test_user, 2, tags_per_recipe=0)
+        by_ingredient.ingredients.create(user=test_user, name="Mango")
+        by_title.title = "Mango sticky rice"
+        by_title.save()
+
+        res = authenticated_client.get(recipes_url, {"search": "mango"})
+
+        assert _ids(res) == [by_title.id, by_ingredient.id]
+
+    def test_search_limited_to_user(
+        self, authenticated_client, recipes_url, user2_recipe
+    ):
+        """Test searching does not return other users' recipes"""
+        res = authenticated_client.get(recipes_url, {"search": "sample"})
+
+        assert res.data == []
+
+    def test_search_paginated(
+        self, authenticated_client, recipes_url, test_user, make_recipes
+    ):
+        """Test walking paginated search results returns each match once"""
+        recipes = make_recipes(test_user, 5)
+
+        res = authenticated_client.get(
+            recipes_url, {"search": "recipe", "page_size": 2}
+        )
+        ids = _ids_page(res)
+        while res.data["next"]:
+            res = authenticated_client.get(res.data["next"])
+            ids += _ids_page(res)
+
+        assert sorted(ids) == sorted(recipe.id for recipe in recipes)
+
+
+def _ids_page(res):
+    return [recipe["id"] for recipe in res.data["results"]]
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from django.urls import reverse
+from recipe.views import RecipeViewSet
+from rest_framework import status
+
+pytestmark = pytest.mark.django_db
+
+
+def _read_stream(res):
+    return json.loads(b"".join(res.streaming_content))
+
+
+class TestStreamingList(object):
+    """Test streaming JSON list responses"""
+
+    @pytest.mark.parametrize(
+        "url_name", ["recipe:recipe-list", "recipe:tag-list", "recipe:ingredient-list"]
+    )
+    def test_stream_matches_list(
+        self, authenticated_client, test_user, make_recipes, url_name
+    ):
+        """Test the streamed array is identical to the regular list"""
+        make_recipes(test_user, 3)
+        url = reverse(url_name)
+
+        res = authenticated_client.get(url, {"stream": 1})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert res.streaming
+        assert res["Content-Type"] == "application/json"
+        assert _read_stream(res) == json.loads(authenticated_client.get(url).content)
+
+    def test_stream_empty(self, authenticated_client):
+        """Test streaming an empty list returns an empty array"""
+        res = authenticated_client.get(reverse("recipe:recipe-list"), {"stream": 1})
+
+        assert _read_stream(res) == []
+
+    def test_stream_respects_filters(
+        self,
+        authenticated_client,
+        sample_tag1,
+        recipe_with_tag_ingredient1,
+        recipe_with_tag_ingredient2,
+    ):
+        """Test streaming applies the same filters as the list"""
+        res = authenticated_client.get(
+            reverse("recipe:recipe-list"), {"stream": 1, "tags": sample_tag1.id}
+        )
+
+        assert [r["id"] for r in _read_stream(res)] == [recipe_with_tag_ingredient1.id]
+
+    def test_stream_prefetches_per_chunk(
+        self, authenticated_client, test_user, make_recipes, query_budget, monkeypatch
+    ):
+        """Test relations are loaded once per chunk rather than per recipe"""
+        monkeypatch.setattr(RecipeViewSet, "stream_chunk_size", 4)
+        make_recipes(test_user, 10)
+
+        # three chunks, each with a tags and an ingredients prefetch
+        with query_budget(3 * 2 + 1):
+            res = authenticated_client.get(reverse("recipe:recipe-list"), {"stream": 1})
+            pieces = list(res.streaming_content)
+
+        assert len(pieces) == 3 + 2
+        assert len(json.loads(b"".join(pieces))) == 10
@@ -82,3 +82,56 @@ class TestPrivateTagsAPI(object):
         assert (
             unassigned_serializer.data not in res.data
         ), "Should not return unassigned ingredient"
+
+    def test_assigned_tags_unique(
+        self,
+        sample_tag1,
+        sample_tag2,
+        test_user,
+        make_recipes,
+        authenticated_client,
+        tags_url,
+    ):
+        """Test assigned tags are returned once however many recipes use them"""
+        for recipe in make_recipes(
+            test_user, 5, tags_per_recipe=0, ingredients_per_recipe=0
+        ):
+            recipe.tags.add(sample_tag1, sample_tag2)
+
+        res = authenticated_client.get(tags_url, {"assigned_only": 1})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert sorted(item["id"] for item in res.data) == sorted(
+            [sample_tag1.id, sample_tag2.id]
+        )
+
+    def test_filter_tags_min_recipes(
+        self,
+        sample_tag1,
+        sample_tag2,
+        test_user,
+        make_recipes,
+        authenticated_client,
+        tags_url,
+    ):
+        """Test filtering tags used by at least N recipes"""
+        recipes = make_recipes(
+            test_user, 3, tags_per_recipe=0, ingredients_per_recipe=0
+        )
+        for recipe in recipes:
+            recipe.tags.add(sample_tag1)
+        recipes[0].tags.add(sample_tag2)
+
+        res = authenticated_client.get(tags_url, {"min_recipes": 3})
+
+        assert res.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in res.data] == [sample_tag1.id]
+
+    @pytest.mark.parametrize("min_recipes", ["0", "-1", "many"])
+    def test_filter_tags_min_recipes_invalid(
+        self, authenticated_client, tags_url, min_recipes
+    ):
+        """Test that an invalid min_recipes returns 400"""
+        res = authenticated_client.get(tags_url, {"min_recipes": min_recipes})
+
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
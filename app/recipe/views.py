@@ -1,8 +1,17 @@
-from core.models import Ingredient, Recipe, Tag
+import zlib
+from collections import Counter
+
+from core.models import SEARCH_CONFIG, Ingredient, Recipe, Tag
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Subquery
 from recipe import serializers
+from recipe.pagination import KeysetPagination
+from recipe.streaming import StreamingListMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
@@ -12,32 +21,117 @@ class GenericRecipeViewSet(viewsets.GenericViewSet):
 
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    pagination_class = KeysetPagination
+    ordering = ("-id",)
+
+    def get_ordering(self):
+        """Return the ordering of list results, also used to paginate them"""
+        return self.ordering
 
 
 class BaseRecipeAttrViewSet(
-    mixins.ListModelMixin, mixins.CreateModelMixin, GenericRecipeViewSet
+    StreamingListMixin,
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    GenericRecipeViewSet,
 ):
     """Base ViewSet for user owned recipe attributes"""
 
+    ordering = ("-name", "-id")
+
     def get_queryset(self):
         """Return objects for the current authenticated user only"""
         assigned_only = bool(self.request.query_params.get("assigned_only"))
+        min_recipes = _param_to_positive_int(self.request.query_params, "min_recipes")
         queryset = self.queryset
-        if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
+        links, target = self._recipe_links()
+        if min_recipes is not None and min_recipes > 1:
+            # the link found at offset N - 1 only exists for objects used by
+            # at least N recipes; the scan stops after N index entries
+            offset = min_recipes - 1
+            nth_link = links.filter(**{target: OuterRef("pk")}).values(target)
+            queryset = queryset.annotate(
+                nth_link=Subquery(nth_link[offset:min_recipes])
+            ).filter(nth_link__isnull=False)
+        elif assigned_only or min_recipes == 1:
+            # IN (subquery) is planned as a semi-join: each object is returned
+            # once, however many recipes use it
+            queryset = queryset.filter(pk__in=links.values(target))
+
+        return queryset.filter(user=self.request.user).order_by(*self.get_ordering())
+
+    def _recipe_links(self):
+        """Return the through table linking recipes to this model, and the name
+        of its column pointing at this model"""
+        field = Recipe._meta.get_field(self.recipe_relation)
+        return (
+            field.remote_field.through.objects.all(),
+            f"{field.m2m_reverse_field_name()}_id",
+        )
 
-        return queryset.filter(user=self.request.user).order_by("-name")
+    def get_serializer_class(self):
+        """Return needed serializer class"""
+        if self.action == "bulk":
+            return serializers.AttrNamesSerializer
+
+        return self.serializer_class
 
     def perform_create(self, serializer):
         """Create a new object"""
         serializer.save(user=self.request.user)
 
+    def _lock_user_names(self):
+        """Serialize concurrent bulk creates of this model for the current user
+
+        The lock is held until the end of the transaction, so a name missing
+        from the lookup cannot be inserted by another batch meanwhile.
+        """
+        model_key = zlib.crc32(self.queryset.model._meta.db_table.encode()) >> 1
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [model_key, self.request.user.id],
+            )
+
+    @action(methods=["POST"], detail=False, url_path="bulk")
+    def bulk(self, request):
+        """Get or create many objects by name
+
+        Existing objects are looked up in one query and the missing ones are
+        inserted in one statement. Returns a mapping of name to id, plus the
+        names that were created.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        names = list(dict.fromkeys(serializer.validated_data["names"]))
+        model = self.queryset.model
+
+        with transaction.atomic():
+            self._lock_user_names()
+            ids = dict(
+                model.objects.filter(user=request.user, name__in=names).values_list(
+                    "name", "id"
+                )
+            )
+            missing = [name for name in names if name not in ids]
+            if missing:
+                created = model.objects.bulk_create(
+                    [model(user=request.user, name=name) for name in missing]
+                )
+                ids.update((obj.name, obj.id) for obj in created)
+
+        return Response(
+            {"ids": {name: ids[name] for name in names}, "created": missing},
+            status=status.HTTP_201_CREATED if missing else status.HTTP_200_OK,
+        )
+
 
 class TagViewSet(BaseRecipeAttrViewSet):
     """Manage tags in the database"""
 
     queryset = Tag.objects.all()
     serializer_class = serializers.TagSerializer
+    recipe_relation = "tags"
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
@@ -45,35 +139,94 @@ class IngredientViewSet(BaseRecipeAttrViewSet):
 
     queryset = Ingredient.objects.all()
     serializer_class = serializers.IngredientSerializer
+    recipe_relation = "ingredients"
+
+
+def _param_to_positive_int(query_params, name):
+    """Return a positive integer query param, or None if it is absent"""
+    value = query_params.get(name)
+    if value is None:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValidationError({name: ["Must be a positive integer."]})
+    return value
 
 
-def _params_to_ints(querystring):
+# maximum value of a postgres integer column
+MAX_ID = 2**31 - 1
+
+# denormalized id array column for each filterable relation
+ATTR_ID_COLUMNS = {"tags": "tag_ids", "ingredients": "ingredient_ids"}
+
+
+def _params_to_ints(querystring, name):
     """Convert a list of string iD to a list of integers"""
-    return [int(str_id) for str_id in querystring.split(",")]
+    try:
+        ids = [int(str_id) for str_id in querystring.split(",")]
+    except ValueError:
+        ids = []
+    if not ids or not all(0 < i <= MAX_ID for i in ids):
+        raise ValidationError({name: ["Must be a comma separated list of ids."]})
+    return ids
 
 
-def _filter_on_attr(queryset, attr_params, attr_name):
+def _filter_on_attr(queryset, attr_params, attr_name, match_all=False):
     if attr_params:
-        # generate name of filter programatically
-        filters = {f"{attr_name}__id__in": _params_to_ints(attr_params)}
+        # @> (contains) for all ids, && (overlap) for any of them, both served
+        # by the GIN index on the id array
+        lookup = "contains" if match_all else "overlap"
+        filters = {
+            f"{ATTR_ID_COLUMNS[attr_name]}__{lookup}": _params_to_ints(
+                attr_params, attr_name
+            )
+        }
         return queryset.filter(**filters)
     return queryset
 
 
-class RecipeViewSet(viewsets.ModelViewSet, GenericRecipeViewSet):
+class RecipeViewSet(StreamingListMixin, viewsets.ModelViewSet, GenericRecipeViewSet):
     """Manage recipes in the database"""
 
     serializer_class = serializers.RecipeSerializer
     queryset = Recipe.objects.all()
+    bulk_max_items = 500
 
     def get_queryset(self):
         """Retrieve the recipes for the authenticated user"""
         queryset = self.queryset
+        match = self.request.query_params.get("match", "any")
+        if match not in ("any", "all"):
+            raise ValidationError({"match": ['Must be "any" or "all".']})
         for attr_name in ["tags", "ingredients"]:
             attr_params = self.request.query_params.get(attr_name)
-            queryset = _filter_on_attr(queryset, attr_params, attr_name)
+            queryset = _filter_on_attr(
+                queryset, attr_params, attr_name, match_all=match == "all"
+            )
+
+        search = self.request.query_params.get("search")
+        if search:
+            query = SearchQuery(search, config=SEARCH_CONFIG)
+            queryset = queryset.annotate(
+                rank=SearchRank(F("search_vector"), query)
+            ).filter(search_vector=query)
 
-        return queryset.filter(user=self.request.user)
+        # load tags and ingredients for the whole page in one query each,
+        # instead of two queries per recipe during serialization
+        return (
+            queryset.filter(user=self.request.user)
+            .prefetch_related("tags", "ingredients")
+            .order_by(*self.get_ordering())
+        )
+
+    def get_ordering(self):
+        """Order search results by relevance"""
+        if self.request.query_params.get("search"):
+            return ("-rank", "-id")
+        return self.ordering
 
     def get_serializer_class(self):
         """Return needed serializer class"""
@@ -88,6 +241,90 @@ class RecipeViewSet(viewsets.ModelViewSet, GenericRecipeViewSet):
         """Create a new recipe"""
         serializer.save(user=self.request.user)
 
+    def _bulk_items(self, request):
+        """Return the list of items in a bulk payload"""
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError("Expected a list of items.")
+        if len(items) > self.bulk_max_items:
+            raise ValidationError(f"At most {self.bulk_max_items} items per request.")
+        return items
+
+    def _bulk_response(self, ids, response_status):
+        """Serialize the given recipes in the order of ids"""
+        recipes = Recipe.objects.filter(id__in=ids).prefetch_related(
+            "tags", "ingredients"
+        )
+        by_id = {recipe.id: recipe for recipe in recipes}
+        serializer = self.get_serializer([by_id[i] for i in ids], many=True)
+        return Response(serializer.data, status=response_status)
+
+    def _bulk_create(self, request):
+        serializer = self.get_serializer(data=self._bulk_items(request), many=True)
+        serializer.is_valid(raise_exception=True)
+        recipes = serializer.save(user=request.user)
+        return self._bulk_response(
+            [recipe.id for recipe in recipes], status.HTTP_201_CREATED
+        )
+
+    def _bulk_update(self, request, partial):
+        items = self._bulk_items(request)
+        ids = [item.get("id") if isinstance(item, dict) else None for item in items]
+        valid_ids = [i for i in ids if isinstance(i, int)]
+        recipes = Recipe.objects.filter(user=request.user, id__in=valid_ids).in_bulk()
+
+        counts = Counter(valid_ids)
+        errors = []
+        for recipe_id in ids:
+            if not isinstance(recipe_id, int) or recipe_id not in recipes:
+                errors.append({"id": ["Not found."]})
+            elif counts[recipe_id] > 1:
+                errors.append({"id": ["Duplicate id."]})
+            else:
+                errors.append({})
+        if any(errors):
+            raise ValidationError(errors)
+
+        serializer = self.get_serializer(
+            [recipes[i] for i in ids], data=items, many=True, partial=partial
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return self._bulk_response(ids, status.HTTP_200_OK)
+
+    def _bulk_delete(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            raise ValidationError({"ids": ["Expected a list of recipe ids."]})
+        if len(ids) > self.bulk_max_items:
+            raise ValidationError(f"At most {self.bulk_max_items} items per request.")
+
+        queryset = Recipe.objects.filter(user=request.user, id__in=ids)
+        found = set(queryset.values_list("id", flat=True))
+        queryset.delete()
+
+        return Response(
+            {
+                "deleted": [i for i in ids if i in found],
+                "not_found": [i for i in ids if i not in found],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(methods=["POST", "PUT", "PATCH", "DELETE"], detail=False, url_path="bulk")
+    def bulk(self, request):
+        """Create, update or delete many recipes in a single transaction
+
+        POST and PUT/PATCH take a list of recipes (with `id` for updates) and
+        return the resulting recipes in the same order. DELETE takes
+        `{"ids": [...]}` and reports which ids were deleted.
+        """
+        if request.method == "POST":
+            return self._bulk_create(request)
+        if request.method == "DELETE":
+            return self._bulk_delete(request)
+        return self._bulk_update(request, partial=request.method == "PATCH")
+
     @action(methods=["POST"], detail=True, url_path="upload-image")
     def upload_image(self, request, pk=None):
         """Upload an image to a recipe"""